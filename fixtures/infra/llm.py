@@ -19,6 +19,6 @@ custom_model_runtime_parameters: list[
     pulumi_datarobot.CustomModelRuntimeParameterValueArgs(
         key="LLM_DEFAULT_MODEL",
         type="string",
-        value="datarobot/azure/gpt-5-mini-2025-08-07",
+        value=default_model,
     ),
 ]
@@ -23,45 +23,51 @@ from ag_ui.core import (
 )
 
 
+async def _generate_agent_response():
+    usage = {"completion_tokens": 1, "prompt_tokens": 2, "total_tokens": 3}
+    zero = {"completion_tokens": 0, "prompt_tokens": 0, "total_tokens": 0}
+
+    yield (
+        RunStartedEvent(
+            type=EventType.RUN_STARTED, thread_id="test-thread", run_id="test-run"
+        ),
+        None,
+        zero,
+    )
+    yield (
+        TextMessageChunkEvent(
+            type=EventType.TEXT_MESSAGE_CHUNK,
+            message_id="test-msg",
+            delta="agent result",
+        ),
+        None,
+        usage,
+    )
+    yield (
+        RunFinishedEvent(
+            type=EventType.RUN_FINISHED, thread_id="test-thread", run_id="test-run"
+        ),
+        [],
+        usage,
+    )
+
+
 @pytest.fixture
 def mock_agent_response():
     """
     Fixture to return a mock agent response based on the agent template framework.
     """
-    usage = {"completion_tokens": 1, "prompt_tokens": 2, "total_tokens": 3}
-    zero = {"completion_tokens": 0, "prompt_tokens": 0, "total_tokens": 0}
-
-    async def generate_response():
-        yield (
-            RunStartedEvent(
-                type=EventType.RUN_STARTED, thread_id="test-thread", run_id="test-run"
-            ),
-            None,
-            zero,
-        )
-        yield (
-            TextMessageChunkEvent(
-                type=EventType.TEXT_MESSAGE_CHUNK,
-                message_id="test-msg",
-                delta="agent result",
-            ),
-            None,
-            usage,
-        )
-        yield (
-            RunFinishedEvent(
-                type=EventType.RUN_FINISHED, thread_id="test-thread", run_id="test-run"
-            ),
-            [],
-            usage,
-        )
-
-    return generate_response()
+    return _generate_agent_response()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def load_model_result():
+    # Built once per session: spinning up a worker thread and event loop per test
+    # is pure setup overhead.
     with ThreadPoolExecutor(1) as thread_pool_executor:
         event_loop = asyncio.new_event_loop()
         thread_pool_executor.submit(asyncio.set_event_loop, event_loop).result()
-        yield (thread_pool_executor, event_loop)
+        try:
+            yield (thread_pool_executor, event_loop)
+        finally:
+            event_loop.close()
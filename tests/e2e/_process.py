@@ -102,9 +102,8 @@ def run_cmd(
     check: bool = True,
     timeout_seconds: int | None = None,
 ) -> str:
-    merged_env = os.environ.copy()
-    if env:
-        merged_env.update(env)
+    # env=None lets the child inherit os.environ without copying it.
+    merged_env = {**os.environ, **env} if env else None
 
     fprint(f"$ {' '.join(cmd)}  (cwd={cwd})")
 
@@ -36,7 +36,7 @@ from datarobot.models.genai.llm_blueprint import LLMBlueprint
 from datarobot.rest import RESTClientObject
 from openai.types.chat import ChatCompletion
 
-from datarobot_genai.core.cli import AgentEnvironment
+from datarobot_genai.core.cli import AgentEnvironment, AgentKernel
 
 from .helpers import (
     ALL_FRAMEWORKS,
@@ -114,13 +114,19 @@ def _assert_agent_workflow_trace(
     entity: str,
     timeout_s: int = 300,
     poll_s: int = 15,
+    initial_poll_s: float = 2.0,
 ) -> None:
-    """Poll an OTel traces endpoint until a non-probe trace has _AGENT_WORKFLOW_SPAN."""
+    """Poll an OTel traces endpoint until a non-probe trace has _AGENT_WORKFLOW_SPAN.
+
+    The wait between polls starts at `initial_poll_s` and doubles up to `poll_s`,
+    so traces that land quickly are picked up without a full `poll_s` delay.
+    """
     start_time = (dt.datetime.now(dt.timezone.utc) - dt.timedelta(hours=2)).strftime(
         "%Y-%m-%dT%H:%M:%SZ"
     )
     roots_seen: set[str] = set()
     deadline = time.monotonic() + timeout_s
+    delay = min(initial_poll_s, poll_s)
     while True:
         traces = _list_recent_traces(client, traces_path, start_time)
         roots_seen.update(t.get("rootSpanName") or "" for t in traces)
@@ -136,12 +142,14 @@ def _assert_agent_workflow_trace(
             ):
                 fprint(f"{entity}: found {_AGENT_WORKFLOW_SPAN} in trace {trace_id}")
                 return
-        if time.monotonic() >= deadline:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
             pytest.fail(
                 f"No agent trace with {_AGENT_WORKFLOW_SPAN} for {entity} after {timeout_s}s "
                 f"({traces_path}). Roots seen: {sorted(roots_seen)}."
             )
-        time.sleep(poll_s)
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, poll_s)
 
 
 def _assert_comparison_prompt_completed(prompt: ComparisonPrompt) -> None:
@@ -175,17 +183,15 @@ def _assert_comparison_prompt_completed(prompt: ComparisonPrompt) -> None:
 
 def _verify_codespace_run(
     *,
+    client: RESTClientObject,
     playground_id: str,
     use_case_id: str,
     user_prompt: str,
-    datarobot_endpoint: str,
-    datarobot_api_token: str,
 ) -> None:
     """Run the agent via a playground ComparisonPrompt, then assert it completed and
     traced to the use-case OTel view (a ComparisonPrompt traces there; a direct chat
     endpoint call does not).
     """
-    client = dr.Client(endpoint=datarobot_endpoint, token=datarobot_api_token)
     fprint("Verifying codespace (agentic-playground) run + traces")
     fprint("=====================================================")
     blueprints = LLMBlueprint.list(playground=playground_id)
@@ -217,17 +223,13 @@ def _verify_codespace_run(
 
 def _verify_deployment_run(
     *,
+    client: RESTClientObject,
+    kernel: AgentKernel,
     user_prompt: str,
     deployment_id: str,
-    datarobot_endpoint: str,
-    datarobot_api_token: str,
 ) -> None:
     fprint("Running deployed agent execution")
     fprint("================================")
-    client = dr.Client(endpoint=datarobot_endpoint, token=datarobot_api_token)
-    kernel = AgentEnvironment(
-        api_token=datarobot_api_token, base_url=datarobot_endpoint
-    ).interface
     completion = cast(
         ChatCompletion,
         kernel.deployment(deployment_id=deployment_id, user_prompt=user_prompt),
@@ -387,13 +389,14 @@ def run_agent_e2e(
         )
         use_case_id = extract_id_from_url(playground_url, marker="usecases")
         fprint(f"Playground ID: {playground_id}  Use case ID: {use_case_id}")
+        # One client (and its keep-alive session) for every verification attempt.
+        dr_client = dr.Client(endpoint=datarobot_endpoint, token=datarobot_api_token)
         retry(
             lambda: _verify_codespace_run(
+                client=dr_client,
                 playground_id=playground_id,
                 use_case_id=use_case_id,
                 user_prompt=user_prompt,
-                datarobot_endpoint=datarobot_endpoint,
-                datarobot_api_token=datarobot_api_token,
             ),
             max_retries=3,
             delay_seconds=60,
@@ -421,12 +424,15 @@ def run_agent_e2e(
             fprint(f"Deployment ID: {deployment_id}")
 
             # Step 11: Run the deployed agent and verify its reply + trace.
+            kernel = AgentEnvironment(
+                api_token=datarobot_api_token, base_url=datarobot_endpoint
+            ).interface
             retry(
                 lambda: _verify_deployment_run(
+                    client=dr_client,
+                    kernel=kernel,
                     user_prompt=user_prompt,
                     deployment_id=deployment_id,
-                    datarobot_endpoint=datarobot_endpoint,
-                    datarobot_api_token=datarobot_api_token,
                 ),
                 max_retries=3,
                 delay_seconds=30,